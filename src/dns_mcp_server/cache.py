@@ -0,0 +1,48 @@
+"""In-process cache with per-entry TTLs."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Optional
+
+
+class TTLCache:
+    """LRU cache where every entry expires after its own TTL."""
+
+    __slots__ = ("max_size", "_entries")
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[tuple[Any, float]]:
+        """Look up a live entry.
+
+        Returns:
+            Tuple of (value, remaining_ttl), or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value, remaining
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value for `ttl` seconds, evicting the least recently used entry if full."""
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
@@ -1,6 +1,7 @@
 """HTTP server for MCP with Streamable HTTP transport."""
 
 import contextlib
+import importlib.util
 import json
 import logging
 import os
@@ -13,6 +14,22 @@ from dns_mcp_server.server import create_server
 
 logger = logging.getLogger(__name__)
 
+# Static response bodies, encoded once at import
+_HEALTH_BODY = json.dumps({"status": "healthy"}, separators=(",", ":")).encode()
+_NOT_FOUND_BODY = json.dumps({"error": "Not found"}, separators=(",", ":")).encode()
+
+
+def _json_headers(body: bytes) -> list[tuple[bytes, bytes]]:
+    """Build response headers for a JSON body."""
+    return [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+
+_HEALTH_HEADERS = _json_headers(_HEALTH_BODY)
+_NOT_FOUND_HEADERS = _json_headers(_NOT_FOUND_BODY)
+
 
 def create_http_server() -> Callable:
     """Create HTTP server wrapping the MCP server.
@@ -32,30 +49,36 @@ def create_http_server() -> Callable:
     # Track whether the session manager is running
     session_manager_context = None
 
-    async def health_response(send):
+    async def health_response(scope, receive, send):
         """Send a health check response."""
         await send({
             "type": "http.response.start",
             "status": 200,
-            "headers": [[b"content-type", b"application/json"]],
+            "headers": _HEALTH_HEADERS,
         })
         await send({
             "type": "http.response.body",
-            "body": json.dumps({"status": "healthy"}).encode(),
+            "body": _HEALTH_BODY,
         })
 
-    async def not_found_response(send):
+    async def not_found_response(scope, receive, send):
         """Send a 404 response."""
         await send({
             "type": "http.response.start",
             "status": 404,
-            "headers": [[b"content-type", b"application/json"]],
+            "headers": _NOT_FOUND_HEADERS,
         })
         await send({
             "type": "http.response.body",
-            "body": json.dumps({"error": "Not found"}).encode(),
+            "body": _NOT_FOUND_BODY,
         })
 
+    # /mcp is delegated to the MCP session manager
+    routes = {
+        "/health": health_response,
+        "/mcp": session_manager.handle_request,
+    }
+
     async def app(scope, receive, send):
         """ASGI application entry point."""
         nonlocal session_manager_context
@@ -80,15 +103,8 @@ def create_http_server() -> Callable:
                     return
 
         elif scope["type"] == "http":
-            path = scope["path"]
-
-            if path == "/health":
-                await health_response(send)
-            elif path == "/mcp":
-                # Delegate to the MCP session manager
-                await session_manager.handle_request(scope, receive, send)
-            else:
-                await not_found_response(send)
+            handler = routes.get(scope["path"], not_found_response)
+            await handler(scope, receive, send)
 
     return app
 
@@ -110,11 +126,16 @@ def main():
     # Create the app
     app = create_http_server()
 
+    # Prefer the libuv-backed event loop; uvloop is not available on Windows
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
     # Run with uvicorn
     uvicorn.run(
         app,
         host=host,
         port=port,
+        loop=loop,
+        http="httptools",
         log_level=os.getenv("LOG_LEVEL", "info").lower(),
     )
 
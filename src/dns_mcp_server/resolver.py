@@ -1,17 +1,26 @@
 """DNS resolver with retry logic."""
 
 import asyncio
+import functools
 import ipaddress
+import math
 import re
+import socket
+import string
 import time
-from typing import Optional, Union
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from dataclasses import replace
+from typing import Optional, TypeVar, Union
 
 import dns.asyncresolver
+import dns.flags
+import dns.name
 import dns.resolver
 import dns.rdatatype
-import dns.reversename
 from dns.exception import DNSException
 
+from dns_mcp_server.cache import TTLCache
 from dns_mcp_server.types import (
     DNSRecord,
     LookupResponse,
@@ -19,20 +28,103 @@ from dns_mcp_server.types import (
     ErrorResponse,
 )
 
+T = TypeVar("T")
+
+# Addresses accepted for reverse lookups, as text or already parsed
+IPAddress = Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address]
+
 # Allowed DNS record types
-ALLOWED_RECORD_TYPES = frozenset({
+ALLOWED_RECORD_TYPES: frozenset[str] = frozenset({
     "A", "AAAA", "MX", "TXT", "NS", "SOA", "CNAME", "SRV", "CAA",
     "PTR", "DNSKEY", "DS", "RRSIG", "NSEC", "NSEC3",
 })
 
+# Allowed record types as listed in validation errors
+_ALLOWED_RECORD_TYPES_TEXT = ", ".join(sorted(ALLOWED_RECORD_TYPES))
+
+# Record type names mapped to dnspython's enum, so queries skip text parsing
+_RDTYPES = {name: dns.rdatatype.from_text(name) for name in ALLOWED_RECORD_TYPES}
+
 # Maximum queries per bulk request
 MAX_BULK_QUERIES = 100
 
 # Maximum concurrent DNS queries
 MAX_CONCURRENT_QUERIES = 20
 
+# EDNS0 UDP payload size (DNS Flag Day 2020 recommendation)
+EDNS_PAYLOAD_SIZE = 1232
+
+# Maximum number of resolver instances kept for reuse
+MAX_CACHED_RESOLVERS = 16
+
+# Maximum number of answers cached per resolver
+ANSWER_CACHE_SIZE = 1000
+
+# Maximum number of parsed IP addresses memoized
+IP_CACHE_SIZE = 4096
+
+# Maximum number of forward lookup results cached
+LOOKUP_CACHE_SIZE = 1024
+
+# Maximum number of reverse lookup results cached
+PTR_CACHE_SIZE = 10000
+
+# Upper bound in seconds on how long any answer is cached
+CACHE_MAX_TTL = 3600
+
+# Seconds to cache definitive failures (NXDOMAIN, no records)
+FAILURE_CACHE_TTL = 60
+
+# Resolver IP ranges to block, checked in order. These match what
+# ipaddress reports as private, multicast or reserved; loopback and
+# link-local ranges are covered by the private list, and IPv4-mapped
+# IPv6 addresses by the reserved ::/8 block.
+BLOCKED_RESOLVER_NETWORKS = [
+    ("Private IP addresses", [
+        "0.0.0.0/8", "10.0.0.0/8", "127.0.0.0/8", "169.254.0.0/16",
+        "172.16.0.0/12", "192.0.0.0/29", "192.0.0.170/31", "192.0.2.0/24",
+        "192.168.0.0/16", "198.18.0.0/15", "198.51.100.0/24",
+        "203.0.113.0/24", "240.0.0.0/4", "255.255.255.255/32",
+        "::1/128", "::/128", "100::/64", "2001::/23",
+        "2001:2::/48", "2001:db8::/32", "2001:10::/28", "fc00::/7",
+        "fe80::/10",
+    ]),
+    ("Multicast addresses", ["224.0.0.0/4", "ff00::/8"]),
+    ("Reserved addresses", [
+        "::/8", "100::/8", "200::/7", "400::/6", "800::/5", "1000::/4",
+        "4000::/3", "6000::/3", "8000::/3", "a000::/3", "c000::/3",
+        "e000::/4", "f000::/5", "f800::/6", "fe00::/9",
+    ]),
+]
+
+
+def _blocked_ranges(version: int) -> list[tuple[int, int, str]]:
+    """Flatten BLOCKED_RESOLVER_NETWORKS into (network, netmask, label) integers."""
+    ranges = []
+    for label, networks in BLOCKED_RESOLVER_NETWORKS:
+        for cidr in networks:
+            net = ipaddress.ip_network(cidr)
+            if net.version == version:
+                ranges.append((int(net.network_address), int(net.netmask), label))
+    return ranges
+
+
+_BLOCKED_IPV4 = _blocked_ranges(4)
+_BLOCKED_IPV6 = _blocked_ranges(6)
+
 # Domain validation pattern (RFC 1035 compliant)
-DOMAIN_LABEL_PATTERN = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$')
+DOMAIN_LABEL_PATTERN = re.compile(r'[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?')
+
+# Whole-name pattern used to accept well-formed domains in one match
+_DOMAIN_PATTERN = re.compile(
+    r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*'
+    r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.?'
+)
+
+# Characters allowed in a domain name, as bytes for the fast check and as a
+# translation table deleting them for reporting the offending characters
+_DOMAIN_BYTES = (string.ascii_letters + string.digits + "-.").encode()
+_DOMAIN_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + "-.")
 
 
 def validate_domain(domain: str) -> tuple[bool, str]:
@@ -48,6 +140,16 @@ def validate_domain(domain: str) -> tuple[bool, str]:
     if len(domain) > 253:
         return False, "Domain name exceeds 253 characters"
 
+    # Reject disallowed characters without walking the labels
+    if not domain.isascii() or domain.encode().translate(None, _DOMAIN_BYTES):
+        invalid_chars = domain.translate(_DOMAIN_CHARS)
+        return False, f"Invalid characters in domain name: {''.join(sorted(set(invalid_chars)))!r}"
+
+    # Fast path: well-formed names need a single regex match
+    if _DOMAIN_PATTERN.fullmatch(domain):
+        return True, ""
+
+    # Slow path: find the offending label for the error message
     # Remove trailing dot if present
     if domain.endswith('.'):
         domain = domain[:-1]
@@ -62,7 +164,7 @@ def validate_domain(domain: str) -> tuple[bool, str]:
             return False, "Empty label in domain name"
         if len(label) > 63:
             return False, f"Label '{label}' exceeds 63 characters"
-        if not DOMAIN_LABEL_PATTERN.match(label):
+        if not DOMAIN_LABEL_PATTERN.fullmatch(label):
             return False, f"Invalid characters in label '{label}'"
 
     return True, ""
@@ -76,28 +178,47 @@ def validate_resolver_ip(ip: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # Anything but text is malformed, and may not be hashable for the memo
+    if not isinstance(ip, str):
+        return False, f"Invalid IP address format: {ip}"
+    return _classify_ip(ip)
+
+
+def _pack_ip(ip: str) -> Optional[bytes]:
+    """Parse an IPv4 or IPv6 address into its 4 or 16 packed bytes.
+
+    Returns:
+        Packed address, or None if `ip` is not a valid address
+    """
+    try:
+        return socket.inet_pton(socket.AF_INET, ip)
+    except (OSError, TypeError, ValueError):
+        pass
     try:
-        addr = ipaddress.ip_address(ip)
-    except ValueError:
+        return socket.inet_pton(socket.AF_INET6, ip)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=IP_CACHE_SIZE)
+def _classify_ip(ip: str) -> tuple[bool, str]:
+    """Classify a resolver IP, memoized since callers repeat the same few."""
+    packed = _pack_ip(ip)
+    if packed is None:
         return False, f"Invalid IP address format: {ip}"
 
     # Block private and reserved ranges
-    if addr.is_private:
-        return False, f"Private IP addresses not allowed: {ip}"
-    if addr.is_loopback:
-        return False, f"Loopback addresses not allowed: {ip}"
-    if addr.is_link_local:
-        return False, f"Link-local addresses not allowed: {ip}"
-    if addr.is_multicast:
-        return False, f"Multicast addresses not allowed: {ip}"
-    if addr.is_reserved:
-        return False, f"Reserved addresses not allowed: {ip}"
+    blocked = _BLOCKED_IPV4 if len(packed) == 4 else _BLOCKED_IPV6
+    addr = int.from_bytes(packed, "big")
+    for network, netmask, label in blocked:
+        if addr & netmask == network:
+            return False, f"{label} not allowed: {ip}"
 
     return True, ""
 
 
 def validate_record_types(record_types: list[str]) -> tuple[bool, str]:
-    """Validate DNS record types against allowlist.
+    """Validate DNS record types against allowlist, ignoring case.
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -105,16 +226,205 @@ def validate_record_types(record_types: list[str]) -> tuple[bool, str]:
     if not record_types:
         return False, "At least one record type is required"
 
-    invalid = set(record_types) - ALLOWED_RECORD_TYPES
+    # Non-string types are malformed, and may not be hashable for the memo
+    invalid = [rdtype for rdtype in record_types if not isinstance(rdtype, str)]
     if invalid:
-        return False, f"Invalid record types: {', '.join(sorted(invalid))}. Allowed: {', '.join(sorted(ALLOWED_RECORD_TYPES))}"
+        return False, f"Invalid record types: {', '.join(map(str, invalid))}. Allowed: {_ALLOWED_RECORD_TYPES_TEXT}"
+    return _validate_record_types(tuple(record_types))
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_record_types(record_types: tuple[str, ...]) -> tuple[bool, str]:
+    """Validate record types, memoized since most calls pass the same few lists."""
+    if not record_types:
+        return False, "At least one record type is required"
+
+    invalid = {rdtype.upper() for rdtype in record_types} - ALLOWED_RECORD_TYPES
+    if invalid:
+        return False, f"Invalid record types: {', '.join(sorted(invalid))}. Allowed: {_ALLOWED_RECORD_TYPES_TEXT}"
 
     return True, ""
 
 
+def _parse_text(rdata, rdtype: str, ttl: int) -> DNSRecord:
+    """Parse any record into its presentation-format text."""
+    return DNSRecord(type=rdtype, value=rdata.to_text(), ttl=ttl)
+
+
+def _parse_address(rdata, rdtype: str, ttl: int) -> DNSRecord:
+    """Parse an A or AAAA record, reading the stored address text directly."""
+    return DNSRecord(type=rdtype, value=rdata.address, ttl=ttl)
+
+
+def _parse_mx(rdata, rdtype: str, ttl: int) -> DNSRecord:
+    """Parse an MX record, exposing the preference as priority."""
+    return DNSRecord(type=rdtype, value=str(rdata.exchange), ttl=ttl, priority=rdata.preference)
+
+
+def _parse_srv(rdata, rdtype: str, ttl: int) -> DNSRecord:
+    """Parse an SRV record into target:port with its priority."""
+    return DNSRecord(type=rdtype, value=f"{rdata.target}:{rdata.port}", ttl=ttl, priority=rdata.priority)
+
+
+def _parse_dnskey(rdata, rdtype: str, ttl: int) -> DNSRecord:
+    """Parse a DNSKEY record with its algorithm and key tag."""
+    # dns.dnssec loads the whole DNSSEC algorithm stack, roughly a fifth of
+    # this module's import time, so defer it until a DNSKEY answer needs it
+    import dns.dnssec
+
+    return DNSRecord(
+        type=rdtype,
+        value=str(rdata),
+        ttl=ttl,
+        algorithm=rdata.algorithm,
+        key_tag=dns.dnssec.key_id(rdata),
+    )
+
+
+def _parse_rrsig(rdata, rdtype: str, ttl: int) -> DNSRecord:
+    """Parse an RRSIG record with its algorithm and signer."""
+    return DNSRecord(
+        type=rdtype,
+        value=str(rdata),
+        ttl=ttl,
+        algorithm=rdata.algorithm,
+        signer=str(rdata.signer),
+    )
+
+
+# Record types parsed other than through the generic text value
+_RECORD_PARSERS = {
+    "A": _parse_address,
+    "AAAA": _parse_address,
+    "MX": _parse_mx,
+    "SRV": _parse_srv,
+    "DNSKEY": _parse_dnskey,
+    "RRSIG": _parse_rrsig,
+}
+
+
+# Reverse lookup zones as dnspython labels, and the IPv4-mapped IPv6 prefix
+_IN_ADDR_ARPA_LABELS = [b"in-addr", b"arpa", b""]
+_IP6_ARPA_LABELS = [b"ip6", b"arpa", b""]
+_IPV4_MAPPED_PREFIX = bytes(10) + b"\xff\xff"
+
+
+def _reverse_name_from_packed(packed: bytes) -> dns.name.Name:
+    """Build the in-addr.arpa / ip6.arpa name for a packed address.
+
+    Labels are taken straight from the address bytes rather than going
+    through dns.reversename's text parsing. IPv4-mapped IPv6 addresses map
+    to in-addr.arpa, as dns.reversename.from_address does.
+    """
+    if len(packed) == 16:
+        if not packed.startswith(_IPV4_MAPPED_PREFIX):
+            labels = [digit.encode() for digit in reversed(packed.hex())]
+            return dns.name.Name(labels + _IP6_ARPA_LABELS)
+        packed = packed[12:]
+
+    labels = [str(octet).encode() for octet in reversed(packed)]
+    return dns.name.Name(labels + _IN_ADDR_ARPA_LABELS)
+
+
+@functools.lru_cache(maxsize=IP_CACHE_SIZE)
+def _reverse_name(ip: str) -> Optional[dns.name.Name]:
+    """Build the reverse lookup name for an address, memoized per IP.
+
+    Returns:
+        Reverse lookup name, or None if `ip` is not a valid address
+    """
+    packed = _pack_ip(ip)
+    if packed is None:
+        return None
+    return _reverse_name_from_packed(packed)
+
+
+def _remaining_ttl(answer: dns.resolver.Answer) -> int:
+    """Seconds until an answer expires.
+
+    dnspython's own answer cache hands back the Answer as first received,
+    so the rrset TTL alone would overstate how long a cached answer is valid.
+    """
+    remaining = math.ceil(answer.expiration - time.time())
+    return max(0, min(remaining, answer.rrset.ttl))
+
+
+# Key for bulk items that cannot be hashed, paired with their position
+_UNHASHABLE = object()
+
+
+def _dedupe(
+    items: Iterable[T], key: Callable[[T], Hashable]
+) -> tuple[list[Hashable], dict[Hashable, T]]:
+    """Group bulk items by key so each distinct item is looked up once.
+
+    Items whose key cannot be built or hashed are malformed input. Each one
+    is keyed by its position instead, so it still gets its own result rather
+    than failing the whole batch.
+
+    Returns:
+        Tuple of (key per item in input order, first item for each key)
+    """
+    keys: list[Hashable] = []
+    unique: dict[Hashable, T] = {}
+    for index, item in enumerate(items):
+        try:
+            item_key = key(item)
+            unique.setdefault(item_key, item)
+        except TypeError:
+            item_key = (_UNHASHABLE, index)
+            unique[item_key] = item
+        keys.append(item_key)
+    return keys, unique
+
+
+async def _bounded_map(
+    aws: list[Awaitable[T]], semaphore: asyncio.Semaphore
+) -> list[Union[T, Exception]]:
+    """Await many awaitables, each holding `semaphore` while it runs.
+
+    Results are returned in input order. A failing awaitable yields its
+    exception in place of a result, so it never aborts the others. If the
+    caller is cancelled, every outstanding awaitable is cancelled with it
+    and has released `semaphore` by the time the cancellation propagates.
+    """
+
+    async def run(aw: Awaitable[T]) -> Union[T, Exception]:
+        async with semaphore:
+            try:
+                return await aw
+            except Exception as e:
+                return e
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(run(aw)) for aw in aws]
+    finally:
+        # Coroutines cancelled before they got a slot were never started;
+        # close them so they are not reported as never awaited
+        for aw in aws:
+            if asyncio.iscoroutine(aw):
+                aw.close()
+    return [task.result() for task in tasks]
+
+
 class DNSResolver:
     """DNS resolver with configurable resolver and retry logic."""
 
+    __slots__ = (
+        "default_resolver",
+        "timeout",
+        "max_retries",
+        "_backoff_times",
+        "_semaphore",
+        "_bulk_semaphore",
+        "_resolvers",
+        "_lookup_success",
+        "_lookup_failure",
+        "_ptr_success",
+        "_ptr_failure",
+    )
+
     def __init__(
         self,
         default_resolver: Optional[str] = None,
@@ -124,13 +434,28 @@ class DNSResolver:
         self.default_resolver = default_resolver
         self.timeout = timeout
         self.max_retries = max_retries
-        self._backoff_times = [0.5, 1.0, 2.0]
-        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        self._backoff_times = (0.5, 1.0, 2.0)
+        self._semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_QUERIES)
+        # Shared by all bulk calls, so concurrent batches share one lookup budget
+        self._bulk_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_QUERIES)
+        # Resolvers keyed by nameserver (None for the system resolver)
+        self._resolvers: OrderedDict[Optional[str], dns.asyncresolver.Resolver] = OrderedDict()
+        # Forward lookup results keyed by (nameserver, domain, record_types)
+        self._lookup_success = TTLCache(LOOKUP_CACHE_SIZE)
+        self._lookup_failure = TTLCache(LOOKUP_CACHE_SIZE)
+        # Reverse lookup results keyed by (nameserver, ip)
+        self._ptr_success = TTLCache(PTR_CACHE_SIZE)
+        self._ptr_failure = TTLCache(PTR_CACHE_SIZE)
 
     def _create_resolver(
         self, resolver_ip: Optional[str] = None
     ) -> Union[dns.asyncresolver.Resolver, ErrorResponse]:
-        """Create a resolver instance with optional custom nameserver.
+        """Get a resolver instance with optional custom nameserver.
+
+        Resolvers are built once per nameserver and reused, so
+        /etc/resolv.conf is only parsed the first time. Each resolver
+        keeps its own TTL-aware answer cache, so answers from one
+        nameserver are never served for another.
 
         Returns:
             Resolver on success, ErrorResponse if resolver_ip validation fails
@@ -145,13 +470,31 @@ class DNSResolver:
                     retries_attempted=0,
                 )
 
+        nameserver = resolver_ip or self.default_resolver
+        res = self._resolvers.get(nameserver)
+        if res is not None:
+            self._resolvers.move_to_end(nameserver)
+            return res
+
         res = dns.asyncresolver.Resolver()
         res.lifetime = self.timeout
+        res.cache = dns.resolver.LRUCache(max_size=ANSWER_CACHE_SIZE)
+        # Advertise a larger UDP payload so big TXT/DNSKEY answers are not
+        # truncated into a TCP retry
+        res.use_edns(0, 0, EDNS_PAYLOAD_SIZE)
+        res.flags = dns.flags.RD
+        # Queries are for fully qualified names; a resolv.conf "search" line
+        # must not turn one lookup into a probe per search domain
+        res.use_search_by_default = False
 
-        nameserver = resolver_ip or self.default_resolver
         if nameserver:
             res.nameservers = [nameserver]
 
+        # Evict the least recently used resolver so caller-supplied IPs can't
+        # grow the pool, while the busy default resolver stays cached
+        if len(self._resolvers) >= MAX_CACHED_RESOLVERS:
+            self._resolvers.popitem(last=False)
+        self._resolvers[nameserver] = res
         return res
 
     def _should_retry(self, exception: Exception) -> bool:
@@ -164,35 +507,6 @@ class DNSResolver:
         )
         return not isinstance(exception, non_retryable)
 
-    def _parse_record(self, rdata, rdtype: str) -> DNSRecord:
-        """Parse a DNS record into our response type."""
-        record = DNSRecord(
-            type=rdtype,
-            value=str(rdata),
-            ttl=0,  # Will be set from rrset
-        )
-
-        # Handle MX priority
-        if rdtype == "MX":
-            record.priority = rdata.preference
-            record.value = str(rdata.exchange)
-
-        # Handle SRV
-        if rdtype == "SRV":
-            record.priority = rdata.priority
-            record.value = f"{rdata.target}:{rdata.port}"
-
-        # Handle DNSSEC records
-        if rdtype == "DNSKEY":
-            record.algorithm = rdata.algorithm
-            record.key_tag = dns.dnssec.key_id(rdata)
-
-        if rdtype == "RRSIG":
-            record.algorithm = rdata.algorithm
-            record.signer = str(rdata.signer)
-
-        return record
-
     async def lookup(
         self,
         domain: str,
@@ -210,6 +524,23 @@ class DNSResolver:
         Returns:
             LookupResponse on success, ErrorResponse on failure
         """
+        # Create resolver (validates resolver_ip if provided)
+        resolver = self._create_resolver(resolver_ip)
+        if isinstance(resolver, ErrorResponse):
+            return replace(resolver, domain=domain)
+
+        return await self._lookup_with_resolver(
+            domain, record_types, resolver, resolver_ip or self.default_resolver
+        )
+
+    async def _lookup_with_resolver(
+        self,
+        domain: str,
+        record_types: list[str],
+        resolver: dns.asyncresolver.Resolver,
+        nameserver: Optional[str],
+    ) -> Union[LookupResponse, ErrorResponse]:
+        """Look up DNS records using an already validated resolver."""
         # Validate domain
         is_valid, error = validate_domain(domain)
         if not is_valid:
@@ -228,70 +559,134 @@ class DNSResolver:
                 retries_attempted=0,
             )
 
-        # Create resolver (validates resolver_ip if provided)
-        resolver = self._create_resolver(resolver_ip)
-        if isinstance(resolver, ErrorResponse):
-            resolver.domain = domain
-            return resolver
+        # Record types are case-insensitive; normalize once for caching and queries
+        record_types = [rdtype.upper() for rdtype in record_types]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        # Serve repeated queries from cache, aging record TTLs by the time cached
+        cache_key = (nameserver, domain.lower(), tuple(record_types))
+        cached = self._lookup_success.get(cache_key)
+        if cached:
+            (records, cached_ttl), remaining_ttl = cached
+            age = int(cached_ttl - remaining_ttl)
+            records = [replace(record, ttl=max(record.ttl - age, 0)) for record in records]
+        else:
+            cached = self._lookup_failure.get(cache_key)
+            if cached:
+                error, _ = cached
+                return ErrorResponse(domain=domain, error=error, retries_attempted=0)
+
+            result = await self._query_records(resolver, domain, record_types, cache_key)
+            if isinstance(result, ErrorResponse):
+                return result
+            records = result
+
+        return LookupResponse(
+            domain=domain,
+            resolver=nameserver,
+            records=records,
+            query_time_ms=int((loop.time() - start) * 1000),
+        )
+
+    async def _query_records(
+        self,
+        resolver: dns.asyncresolver.Resolver,
+        domain: str,
+        record_types: list[str],
+        cache_key: tuple,
+    ) -> Union[list[DNSRecord], ErrorResponse]:
+        """Query all record types concurrently, caching the outcome.
+
+        Returns:
+            Merged records on success, ErrorResponse on failure
+        """
+        results = await asyncio.gather(
+            *(self._resolve_type(resolver, domain, rdtype) for rdtype in record_types)
+        )
 
         records: list[DNSRecord] = []
-        start_time = time.monotonic()
         last_error: Optional[Exception] = None
 
-        async with self._semaphore:
-            for rdtype in record_types:
-                for attempt in range(self.max_retries):
-                    try:
-                        answer = await resolver.resolve(domain, rdtype)
-                        for rdata in answer:
-                            record = self._parse_record(rdata, rdtype)
-                            record.ttl = answer.rrset.ttl
-                            records.append(record)
-                        break  # Success, move to next record type
-
-                    except dns.resolver.NXDOMAIN:
-                        return ErrorResponse(
-                            domain=domain,
-                            error="NXDOMAIN: Domain does not exist",
-                            retries_attempted=attempt + 1,
-                        )
-
-                    except dns.resolver.NoAnswer:
-                        # No records of this type, continue to next type
-                        break
-
-                    except DNSException as e:
-                        last_error = e
-                        if not self._should_retry(e) or attempt == self.max_retries - 1:
-                            break
-                        await asyncio.sleep(self._backoff_times[min(attempt, len(self._backoff_times) - 1)])
-
-            query_time = int((time.monotonic() - start_time) * 1000)
-
-            if not records and last_error:
+        for type_records, error, attempts in results:
+            if isinstance(error, dns.resolver.NXDOMAIN):
+                error = "NXDOMAIN: Domain does not exist"
+                self._lookup_failure.set(cache_key, error, FAILURE_CACHE_TTL)
                 return ErrorResponse(
                     domain=domain,
-                    error=str(last_error),
-                    retries_attempted=self.max_retries,
+                    error=error,
+                    retries_attempted=attempts,
                 )
+            if error:
+                last_error = error
+            records.extend(type_records)
 
-            return LookupResponse(
+        if not records and last_error:
+            return ErrorResponse(
                 domain=domain,
-                resolver=resolver_ip or self.default_resolver,
-                records=records,
-                query_time_ms=query_time,
+                error=str(last_error),
+                retries_attempted=self.max_retries,
             )
 
+        # A partial answer (some types failed transiently) is returned but not
+        # cached, so the failed types are queried again next time
+        if last_error is None:
+            # Cache until the first record expires; an empty answer is a negative result
+            if records:
+                ttl = min(min(record.ttl for record in records), CACHE_MAX_TTL)
+            else:
+                ttl = FAILURE_CACHE_TTL
+            # Cache a tuple so callers mutating their response list can't alter it
+            self._lookup_success.set(cache_key, (tuple(records), ttl), ttl)
+        return records
+
+    async def _resolve_type(
+        self,
+        resolver: dns.asyncresolver.Resolver,
+        domain: str,
+        rdtype: str,
+    ) -> tuple[list[DNSRecord], Optional[DNSException], int]:
+        """Query a single record type with retries.
+
+        Returns:
+            Tuple of (records, error, attempts). A missing record type
+            yields no records and no error.
+        """
+        for attempt in range(self.max_retries):
+            try:
+                # Hold a concurrency slot only for the wire query itself
+                async with self._semaphore:
+                    answer = await resolver.resolve(domain, _RDTYPES[rdtype])
+                ttl = _remaining_ttl(answer)
+                parse = _RECORD_PARSERS.get(rdtype, _parse_text)
+                records = [parse(rdata, rdtype, ttl) for rdata in answer]
+                return records, None, attempt + 1
+
+            except dns.resolver.NXDOMAIN as e:
+                return [], e, attempt + 1
+
+            except dns.resolver.NoAnswer:
+                # No records of this type
+                return [], None, attempt + 1
+
+            except DNSException as e:
+                if not self._should_retry(e) or attempt == self.max_retries - 1:
+                    return [], e, attempt + 1
+                await asyncio.sleep(self._backoff_times[min(attempt, len(self._backoff_times) - 1)])
+
+        return [], None, self.max_retries
+
     async def reverse_lookup(
         self,
-        ip: str,
+        ip: IPAddress,
         resolver_ip: Optional[str] = None,
     ) -> Union[ReverseLookupResponse, ErrorResponse]:
         """
         Perform reverse DNS lookup for an IP address.
 
         Args:
-            ip: IPv4 or IPv6 address
+            ip: IPv4 or IPv6 address, as text or an ipaddress object
             resolver_ip: Optional resolver IP to use
 
         Returns:
@@ -300,111 +695,213 @@ class DNSResolver:
         # Create resolver (validates resolver_ip if provided)
         resolver = self._create_resolver(resolver_ip)
         if isinstance(resolver, ErrorResponse):
-            resolver.ip = ip
-            return resolver
+            return replace(resolver, ip=str(ip))
 
-        start_time = time.monotonic()
+        return await self._reverse_lookup_with_resolver(
+            ip, resolver, resolver_ip or self.default_resolver
+        )
 
-        try:
-            rev_name = dns.reversename.from_address(ip)
-        except Exception as e:
+    async def _reverse_lookup_with_resolver(
+        self,
+        ip: IPAddress,
+        resolver: dns.asyncresolver.Resolver,
+        nameserver: Optional[str],
+    ) -> Union[ReverseLookupResponse, ErrorResponse]:
+        """Perform a reverse lookup using an already validated resolver."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        # Address objects are already parsed; reuse their packed form
+        packed = None
+        if isinstance(ip, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+            packed = ip.packed
+            ip = str(ip)
+        elif not isinstance(ip, str):
+            # Malformed input (e.g. a JSON number); may not even be hashable
             return ErrorResponse(
-                ip=ip,
-                error=f"Invalid IP address: {e}",
+                ip=str(ip),
+                error=f"Invalid IP address: {ip}",
                 retries_attempted=0,
             )
 
-        async with self._semaphore:
-            for attempt in range(self.max_retries):
-                try:
-                    answer = await resolver.resolve(rev_name, "PTR")
-                    hostname = str(answer[0]).rstrip(".")
-                    query_time = int((time.monotonic() - start_time) * 1000)
+        # Serve repeated addresses from cache without touching the wire
+        cache_key = (nameserver, ip)
+        cached = self._ptr_success.get(cache_key)
+        if cached:
+            hostname, remaining_ttl = cached
+            ttl = int(remaining_ttl)
+        else:
+            cached = self._ptr_failure.get(cache_key)
+            if cached:
+                error, _ = cached
+                return ErrorResponse(ip=ip, error=error, retries_attempted=0)
+
+            if packed is None:
+                rev_name = _reverse_name(ip)
+            else:
+                rev_name = _reverse_name_from_packed(packed)
+            if rev_name is None:
+                return ErrorResponse(
+                    ip=ip,
+                    error=f"Invalid IP address: {ip}",
+                    retries_attempted=0,
+                )
 
-                    return ReverseLookupResponse(
-                        ip=ip,
-                        hostname=hostname,
-                        ttl=answer.rrset.ttl,
-                        query_time_ms=query_time,
-                        resolver=resolver_ip or self.default_resolver,
-                    )
+            result = await self._resolve_ptr(resolver, ip, rev_name, cache_key)
+            if isinstance(result, ErrorResponse):
+                return result
+            hostname, ttl = result
+
+        return ReverseLookupResponse(
+            ip=ip,
+            hostname=hostname,
+            ttl=ttl,
+            query_time_ms=int((loop.time() - start) * 1000),
+            resolver=nameserver,
+        )
+
+    async def _resolve_ptr(
+        self,
+        resolver: dns.asyncresolver.Resolver,
+        ip: str,
+        rev_name: dns.name.Name,
+        cache_key: tuple,
+    ) -> Union[tuple[str, int], ErrorResponse]:
+        """Query the PTR record for an address with retries, caching the outcome.
+
+        Returns:
+            Tuple of (hostname, ttl) on success, ErrorResponse on failure
+        """
+        for attempt in range(self.max_retries):
+            try:
+                async with self._semaphore:
+                    answer = await resolver.resolve(rev_name, dns.rdatatype.PTR)
+                hostname = str(answer[0]).rstrip(".")
+                ttl = _remaining_ttl(answer)
+                self._ptr_success.set(cache_key, hostname, min(ttl, CACHE_MAX_TTL))
+                return hostname, ttl
+
+            except dns.resolver.NXDOMAIN:
+                error = "NXDOMAIN: No PTR record found"
+                self._ptr_failure.set(cache_key, error, FAILURE_CACHE_TTL)
+                return ErrorResponse(
+                    ip=ip,
+                    error=error,
+                    retries_attempted=attempt + 1,
+                )
 
-                except dns.resolver.NXDOMAIN:
+            except DNSException as e:
+                retryable = self._should_retry(e)
+                if not retryable:
+                    self._ptr_failure.set(cache_key, str(e), FAILURE_CACHE_TTL)
+                if not retryable or attempt == self.max_retries - 1:
                     return ErrorResponse(
                         ip=ip,
-                        error="NXDOMAIN: No PTR record found",
+                        error=str(e),
                         retries_attempted=attempt + 1,
                     )
+                await asyncio.sleep(self._backoff_times[min(attempt, len(self._backoff_times) - 1)])
 
-                except DNSException as e:
-                    if not self._should_retry(e) or attempt == self.max_retries - 1:
-                        query_time = int((time.monotonic() - start_time) * 1000)
-                        return ErrorResponse(
-                            ip=ip,
-                            error=str(e),
-                            retries_attempted=attempt + 1,
-                        )
-                    await asyncio.sleep(self._backoff_times[min(attempt, len(self._backoff_times) - 1)])
-
-            return ErrorResponse(
-                ip=ip,
-                error="Max retries exceeded",
-                retries_attempted=self.max_retries,
-            )
+        return ErrorResponse(
+            ip=ip,
+            error="Max retries exceeded",
+            retries_attempted=self.max_retries,
+        )
 
     async def bulk_lookup(
         self,
-        queries: list[dict],
+        queries: Sequence[dict],
         resolver_ip: Optional[str] = None,
     ) -> Union[list[Union[LookupResponse, ErrorResponse]], ErrorResponse]:
         """
         Perform bulk DNS lookups.
 
         Args:
-            queries: List of {"domain": str, "record_types": list[str]}
+            queries: Sequence of {"domain": str, "record_types": list[str]}
             resolver_ip: Optional resolver IP to use for all queries
 
         Returns:
-            List of responses (LookupResponse or ErrorResponse), or ErrorResponse if limit exceeded
+            List of responses (LookupResponse or ErrorResponse), or ErrorResponse if
+            the limit is exceeded or resolver_ip is invalid
         """
-        if len(queries) > MAX_BULK_QUERIES:
+        # Reject oversized batches before touching any element
+        count = len(queries)
+        if count > MAX_BULK_QUERIES:
             return ErrorResponse(
                 domain="",
-                error=f"Bulk query limit exceeded: {len(queries)} queries requested, maximum is {MAX_BULK_QUERIES}",
+                error=f"Bulk query limit exceeded: {count} queries requested, maximum is {MAX_BULK_QUERIES}",
                 retries_attempted=0,
             )
 
+        # Validate the shared resolver once rather than per query
+        resolver = self._create_resolver(resolver_ip)
+        if isinstance(resolver, ErrorResponse):
+            return resolver
+        nameserver = resolver_ip or self.default_resolver
+
+        # Issue one lookup per distinct query and fan the result back out
+        keys, unique = _dedupe(
+            ((q["domain"], q.get("record_types", ["A"])) for q in queries),
+            lambda query: (query[0], tuple(query[1])),
+        )
         tasks = [
-            self.lookup(
-                q["domain"],
-                q.get("record_types", ["A"]),
-                resolver_ip,
-            )
-            for q in queries
+            self._lookup_with_resolver(domain, record_types, resolver, nameserver)
+            for domain, record_types in unique.values()
         ]
-        return await asyncio.gather(*tasks)
+        results = await _bounded_map(tasks, self._bulk_semaphore)
+
+        # One failing query must not take down its siblings
+        by_key = {
+            key: ErrorResponse(domain=domain, error=str(result), retries_attempted=0)
+            if isinstance(result, Exception)
+            else result
+            for (key, (domain, _)), result in zip(unique.items(), results)
+        }
+        return [by_key[key] for key in keys]
 
     async def bulk_reverse_lookup(
         self,
-        ips: list[str],
+        ips: Sequence[IPAddress],
         resolver_ip: Optional[str] = None,
     ) -> Union[list[Union[ReverseLookupResponse, ErrorResponse]], ErrorResponse]:
         """
         Perform bulk reverse DNS lookups.
 
         Args:
-            ips: List of IPv4 or IPv6 addresses
+            ips: Sequence of IPv4 or IPv6 addresses, as text or ipaddress objects
             resolver_ip: Optional resolver IP to use for all queries
 
         Returns:
-            List of responses (ReverseLookupResponse or ErrorResponse), or ErrorResponse if limit exceeded
+            List of responses (ReverseLookupResponse or ErrorResponse), or ErrorResponse if
+            the limit is exceeded or resolver_ip is invalid
         """
-        if len(ips) > MAX_BULK_QUERIES:
+        # Reject oversized batches before touching any element
+        count = len(ips)
+        if count > MAX_BULK_QUERIES:
             return ErrorResponse(
                 ip="",
-                error=f"Bulk query limit exceeded: {len(ips)} queries requested, maximum is {MAX_BULK_QUERIES}",
+                error=f"Bulk query limit exceeded: {count} queries requested, maximum is {MAX_BULK_QUERIES}",
                 retries_attempted=0,
             )
 
-        tasks = [self.reverse_lookup(ip, resolver_ip) for ip in ips]
-        return await asyncio.gather(*tasks)
+        # Validate the shared resolver once rather than per query
+        resolver = self._create_resolver(resolver_ip)
+        if isinstance(resolver, ErrorResponse):
+            return ErrorResponse(ip="", error=resolver.error, retries_attempted=0)
+        nameserver = resolver_ip or self.default_resolver
+
+        # Issue one lookup per distinct address and fan the result back out
+        keys, unique = _dedupe(ips, lambda ip: ip)
+        tasks = [
+            self._reverse_lookup_with_resolver(ip, resolver, nameserver) for ip in unique.values()
+        ]
+        results = await _bounded_map(tasks, self._bulk_semaphore)
+
+        # One failing query must not take down its siblings
+        by_key = {
+            key: ErrorResponse(ip=str(ip), error=str(result), retries_attempted=0)
+            if isinstance(result, Exception)
+            else result
+            for (key, ip), result in zip(unique.items(), results)
+        }
+        return [by_key[key] for key in keys]
@@ -4,15 +4,20 @@ import asyncio
 import json
 import logging
 import os
-from dataclasses import asdict
-from typing import Any
+from typing import Any, Optional, Union
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import ListToolsResult, Tool, TextContent
 
 from dns_mcp_server.resolver import DNSResolver
-from dns_mcp_server.types import LookupResponse, ReverseLookupResponse
+from dns_mcp_server.types import ErrorResponse
+
+try:
+    import orjson
+except ImportError:
+    # orjson ships with the "fast" extra; serialize with the stdlib otherwise
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -26,158 +31,202 @@ DEFAULT_TIMEOUT = float(os.getenv("DNS_TIMEOUT", "5"))
 DEFAULT_RETRIES = int(os.getenv("DNS_RETRIES", "3"))
 DEFAULT_RESOLVER = os.getenv("DEFAULT_RESOLVER")
 
-
-def create_server() -> Server:
-    """Create and configure the MCP server."""
-    server = Server("dns-mcp-server")
-    resolver = DNSResolver(
-        default_resolver=DEFAULT_RESOLVER,
-        timeout=DEFAULT_TIMEOUT,
-        max_retries=DEFAULT_RETRIES,
-    )
-
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        """List available DNS tools."""
-        return [
-            Tool(
-                name="dns_lookup",
-                description="Query DNS records for a domain. Supports all record types including DNSSEC.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "Domain name to query",
-                        },
-                        "record_types": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Record types to query (default: ['A']). Examples: A, AAAA, MX, TXT, NS, SOA, CNAME, SRV, CAA, DNSKEY, DS, RRSIG",
-                            "default": ["A"],
-                        },
-                        "resolver": {
-                            "type": "string",
-                            "description": "DNS resolver IP to use (optional, defaults to system resolver)",
-                        },
-                    },
-                    "required": ["domain"],
+# Tool definitions are static, so build them once at import
+_TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="dns_lookup",
+        description="Query DNS records for a domain. Supports all record types including DNSSEC.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "Domain name to query",
                 },
-            ),
-            Tool(
-                name="dns_reverse",
-                description="Reverse DNS lookup (PTR) for an IP address.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "ip": {
-                            "type": "string",
-                            "description": "IPv4 or IPv6 address",
-                        },
-                        "resolver": {
-                            "type": "string",
-                            "description": "DNS resolver IP to use (optional)",
-                        },
-                    },
-                    "required": ["ip"],
+                "record_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Record types to query (default: ['A']). Examples: A, AAAA, MX, TXT, NS, SOA, CNAME, SRV, CAA, DNSKEY, DS, RRSIG",
+                    "default": ["A"],
+                },
+                "resolver": {
+                    "type": "string",
+                    "description": "DNS resolver IP to use (optional, defaults to system resolver)",
+                },
+            },
+            "required": ["domain"],
+        },
+    ),
+    Tool(
+        name="dns_reverse",
+        description="Reverse DNS lookup (PTR) for an IP address.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ip": {
+                    "type": "string",
+                    "description": "IPv4 or IPv6 address",
+                },
+                "resolver": {
+                    "type": "string",
+                    "description": "DNS resolver IP to use (optional)",
                 },
-            ),
-            Tool(
-                name="dns_bulk",
-                description="Query DNS records for multiple domains in one call.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "queries": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "domain": {"type": "string"},
-                                    "record_types": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                    },
-                                },
-                                "required": ["domain"],
+            },
+            "required": ["ip"],
+        },
+    ),
+    Tool(
+        name="dns_bulk",
+        description="Query DNS records for multiple domains in one call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "domain": {"type": "string"},
+                            "record_types": {
+                                "type": "array",
+                                "items": {"type": "string"},
                             },
-                            "description": "List of queries with domain and optional record_types",
-                        },
-                        "resolver": {
-                            "type": "string",
-                            "description": "DNS resolver IP to use for all queries (optional)",
                         },
+                        "required": ["domain"],
                     },
-                    "required": ["queries"],
+                    "description": "List of queries with domain and optional record_types",
                 },
-            ),
-            Tool(
-                name="dns_reverse_bulk",
-                description="Reverse DNS lookup for multiple IP addresses.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "ips": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of IPv4 or IPv6 addresses",
-                        },
-                        "resolver": {
-                            "type": "string",
-                            "description": "DNS resolver IP to use for all queries (optional)",
-                        },
-                    },
-                    "required": ["ips"],
+                "resolver": {
+                    "type": "string",
+                    "description": "DNS resolver IP to use for all queries (optional)",
                 },
-            ),
-        ]
+            },
+            "required": ["queries"],
+        },
+    ),
+    Tool(
+        name="dns_reverse_bulk",
+        description="Reverse DNS lookup for multiple IP addresses.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ips": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of IPv4 or IPv6 addresses",
+                },
+                "resolver": {
+                    "type": "string",
+                    "description": "DNS resolver IP to use for all queries (optional)",
+                },
+            },
+            "required": ["ips"],
+        },
+    ),
+)
+
+# The list_tools reply never changes, so validate it once rather than per request
+_LIST_TOOLS_RESULT = ListToolsResult(tools=list(_TOOLS))
+
+
+async def _list_tools() -> ListToolsResult:
+    """List available DNS tools."""
+    return _LIST_TOOLS_RESULT
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize tool output as indented JSON."""
+    if orjson is None:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _dumps_bulk(results: Union[list, ErrorResponse]) -> str:
+    """Serialize bulk results as compact JSON, one item at a time.
+
+    Bulk responses can hold hundreds of records, so they skip indentation
+    and never build an intermediate list of dicts.
+    """
+    if isinstance(results, ErrorResponse):
+        return _dumps(results.to_dict())
+    if orjson is None:
+        return json.dumps(
+            [r.to_dict() for r in results], separators=(",", ":"), ensure_ascii=False
+        )
+    return (b"[" + b",".join(orjson.dumps(r.to_dict()) for r in results) + b"]").decode()
+
+
+def create_server(resolver: Optional[DNSResolver] = None) -> Server:
+    """Create and configure the MCP server.
+
+    All tool handlers share one resolver, so its resolver pool and answer
+    caches are reused across calls. Pass `resolver` to share it between
+    servers as well.
+    """
+    server = Server("dns-mcp-server")
+    if resolver is None:
+        resolver = DNSResolver(
+            default_resolver=DEFAULT_RESOLVER,
+            timeout=DEFAULT_TIMEOUT,
+            max_retries=DEFAULT_RETRIES,
+        )
+
+    server.list_tools()(_list_tools)
+
+    async def dns_lookup(arguments: dict[str, Any]) -> str:
+        result = await resolver.lookup(
+            domain=arguments["domain"],
+            record_types=arguments.get("record_types", ["A"]),
+            resolver_ip=arguments.get("resolver"),
+        )
+        return _dumps(result.to_dict())
+
+    async def dns_reverse(arguments: dict[str, Any]) -> str:
+        result = await resolver.reverse_lookup(
+            ip=arguments["ip"],
+            resolver_ip=arguments.get("resolver"),
+        )
+        return _dumps(result.to_dict())
+
+    async def dns_bulk(arguments: dict[str, Any]) -> str:
+        results = await resolver.bulk_lookup(
+            queries=arguments["queries"],
+            resolver_ip=arguments.get("resolver"),
+        )
+        return _dumps_bulk(results)
+
+    async def dns_reverse_bulk(arguments: dict[str, Any]) -> str:
+        results = await resolver.bulk_reverse_lookup(
+            ips=arguments["ips"],
+            resolver_ip=arguments.get("resolver"),
+        )
+        return _dumps_bulk(results)
+
+    tool_handlers = {
+        "dns_lookup": dns_lookup,
+        "dns_reverse": dns_reverse,
+        "dns_bulk": dns_bulk,
+        "dns_reverse_bulk": dns_reverse_bulk,
+    }
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle tool calls."""
-        logger.info(f"Tool call: {name} with arguments: {arguments}")
+        logger.info("Tool call: %s with arguments: %s", name, arguments)
+
+        handler = tool_handlers.get(name)
+        if handler is None:
+            error_response = {"error": f"Unknown tool: {name}", "success": False}
+            return [TextContent(type="text", text=_dumps(error_response))]
 
         try:
-            if name == "dns_lookup":
-                result = await resolver.lookup(
-                    domain=arguments["domain"],
-                    record_types=arguments.get("record_types", ["A"]),
-                    resolver_ip=arguments.get("resolver"),
-                )
-
-            elif name == "dns_reverse":
-                result = await resolver.reverse_lookup(
-                    ip=arguments["ip"],
-                    resolver_ip=arguments.get("resolver"),
-                )
-
-            elif name == "dns_bulk":
-                results = await resolver.bulk_lookup(
-                    queries=arguments["queries"],
-                    resolver_ip=arguments.get("resolver"),
-                )
-                result = [asdict(r) for r in results]
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-            elif name == "dns_reverse_bulk":
-                results = await resolver.bulk_reverse_lookup(
-                    ips=arguments["ips"],
-                    resolver_ip=arguments.get("resolver"),
-                )
-                result = [asdict(r) for r in results]
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-            else:
-                error_response = {"error": f"Unknown tool: {name}", "success": False}
-                return [TextContent(type="text", text=json.dumps(error_response, indent=2))]
-
-            # Convert single result to JSON
-            return [TextContent(type="text", text=json.dumps(asdict(result), indent=2))]
+            text = await handler(arguments)
+            return [TextContent(type="text", text=text)]
 
         except Exception as e:
-            logger.error(f"Tool {name} failed: {e}")
+            logger.error("Tool %s failed: %s", name, e)
             error_response = {"error": str(e), "success": False}
-            return [TextContent(type="text", text=json.dumps(error_response, indent=2))]
+            return [TextContent(type="text", text=_dumps(error_response))]
 
     return server
 
@@ -190,7 +239,13 @@ def main():
         async with stdio_server() as (read_stream, write_stream):
             await server.run(read_stream, write_stream, server.create_initialization_options())
 
-    asyncio.run(run())
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows
+        asyncio.run(run())
+    else:
+        uvloop.run(run())
 
 
 if __name__ == "__main__":
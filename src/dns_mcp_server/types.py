@@ -1,10 +1,10 @@
 """Response type definitions for DNS MCP Server."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DNSRecord:
     """A single DNS record."""
 
@@ -18,8 +18,21 @@ class DNSRecord:
     signature: Optional[str] = None
     signer: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "type": self.type,
+            "value": self.value,
+            "ttl": self.ttl,
+            "priority": self.priority,
+            "algorithm": self.algorithm,
+            "key_tag": self.key_tag,
+            "signature": self.signature,
+            "signer": self.signer,
+        }
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class LookupResponse:
     """Response for a successful DNS lookup."""
 
@@ -27,10 +40,20 @@ class LookupResponse:
     records: list[DNSRecord]
     query_time_ms: int
     resolver: Optional[str] = None
-    success: bool = True
+    success: ClassVar[bool] = True
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "domain": self.domain,
+            "records": [record.to_dict() for record in self.records],
+            "query_time_ms": self.query_time_ms,
+            "resolver": self.resolver,
+            "success": self.success,
+        }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReverseLookupResponse:
     """Response for a successful reverse DNS lookup."""
 
@@ -39,10 +62,21 @@ class ReverseLookupResponse:
     ttl: int
     query_time_ms: int
     resolver: Optional[str] = None
-    success: bool = True
+    success: ClassVar[bool] = True
 
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "ip": self.ip,
+            "hostname": self.hostname,
+            "ttl": self.ttl,
+            "query_time_ms": self.query_time_ms,
+            "resolver": self.resolver,
+            "success": self.success,
+        }
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ErrorResponse:
     """Response for a failed DNS query."""
 
@@ -50,4 +84,14 @@ class ErrorResponse:
     retries_attempted: int
     domain: Optional[str] = None
     ip: Optional[str] = None
-    success: bool = False
+    success: ClassVar[bool] = False
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "error": self.error,
+            "retries_attempted": self.retries_attempted,
+            "domain": self.domain,
+            "ip": self.ip,
+            "success": self.success,
+        }
@@ -0,0 +1,47 @@
+"""Tests for the TTL cache."""
+
+import time
+
+from dns_mcp_server.cache import TTLCache
+
+
+def test_cache_get_returns_value_and_remaining_ttl():
+    cache = TTLCache(max_size=10)
+    cache.set("key", "value", 60)
+
+    value, remaining = cache.get("key")
+    assert value == "value"
+    assert 0 < remaining <= 60
+
+
+def test_cache_miss_returns_none():
+    cache = TTLCache(max_size=10)
+    assert cache.get("missing") is None
+
+
+def test_cache_entry_expires(monkeypatch):
+    cache = TTLCache(max_size=10)
+    cache.set("key", "value", 5)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_cache_ignores_zero_ttl():
+    cache = TTLCache(max_size=10)
+    cache.set("key", "value", 0)
+    assert cache.get("key") is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.set("c", 3, 60)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
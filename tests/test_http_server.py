@@ -12,3 +12,14 @@ def test_health_endpoint_returns_healthy():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_unknown_path_returns_not_found():
+    """Test that unknown paths return a JSON 404."""
+    from dns_mcp_server.http_server import create_http_server
+
+    app = create_http_server()
+    client = TestClient(app)
+    response = client.get("/nope")
+    assert response.status_code == 404
+    assert response.json() == {"error": "Not found"}
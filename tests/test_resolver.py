@@ -1,15 +1,35 @@
 """Tests for DNS resolver."""
 
+import asyncio
+import ipaddress
+import time
+
+import dns.dnssec
+import dns.exception
+import dns.message
+import dns.name
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
+import dns.resolver
+import dns.reversename
 import pytest
 from dns_mcp_server.resolver import (
     DNSResolver,
+    _RECORD_PARSERS,
+    _bounded_map,
+    _parse_text,
+    _reverse_name,
     validate_domain,
     validate_resolver_ip,
     validate_record_types,
     MAX_BULK_QUERIES,
+    MAX_CONCURRENT_QUERIES,
+    MAX_CACHED_RESOLVERS,
+    EDNS_PAYLOAD_SIZE,
     ALLOWED_RECORD_TYPES,
 )
-from dns_mcp_server.types import LookupResponse, ReverseLookupResponse, ErrorResponse
+from dns_mcp_server.types import DNSRecord, LookupResponse, ReverseLookupResponse, ErrorResponse
 
 
 # Tests for validation functions
@@ -75,6 +95,44 @@ def test_validate_resolver_ip_blocks_private():
         assert not is_valid, f"IP '{ip}' should be blocked ({reason})"
 
 
+def test_validate_resolver_ip_blocks_special_ranges():
+    """Test multicast, reserved and IPv4-mapped addresses are blocked."""
+    blocked_ips = [
+        ("224.0.0.1", "Multicast"),
+        ("ff02::1", "Multicast"),
+        ("240.0.0.1", "Private"),
+        ("::ffff:8.8.8.8", "Reserved"),
+        ("::ffff:10.0.0.1", "Reserved"),
+    ]
+    for ip, label in blocked_ips:
+        is_valid, error = validate_resolver_ip(ip)
+        assert not is_valid, f"IP '{ip}' should be blocked"
+        assert label in error
+
+
+def test_validate_resolver_ip_invalid_format():
+    """Test malformed IP addresses are rejected."""
+    for ip in ["not-an-ip", "1.2.3", "01.2.3.4", "8.8.8.8 "]:
+        is_valid, error = validate_resolver_ip(ip)
+        assert not is_valid
+        assert "Invalid IP address format" in error
+
+
+def test_validate_resolver_ip_non_string():
+    """Test non-string resolver IPs are rejected rather than raising."""
+    for ip in [["8.8.8.8"], {"ip": "8.8.8.8"}, 8]:
+        is_valid, error = validate_resolver_ip(ip)
+        assert not is_valid
+        assert "Invalid IP address format" in error
+
+
+def test_validate_record_types_non_string():
+    """Test non-string record types are rejected rather than raising."""
+    is_valid, error = validate_record_types(["A", ["MX"]])
+    assert not is_valid
+    assert "Invalid record types" in error
+
+
 def test_validate_record_types_valid():
     """Test valid record types pass validation."""
     is_valid, error = validate_record_types(["A", "AAAA", "MX", "TXT"])
@@ -89,6 +147,16 @@ def test_validate_record_types_invalid():
     assert "FAKE" in error
 
 
+def test_validate_record_types_case_insensitive():
+    """Test record types are matched regardless of case."""
+    is_valid, error = validate_record_types(["a", "Mx", "dnskey"])
+    assert is_valid, f"Lowercase record types should pass: {error}"
+
+    is_valid, error = validate_record_types(["a", "bogus"])
+    assert not is_valid
+    assert "BOGUS" in error
+
+
 def test_validate_record_types_empty():
     """Test empty record types list fails validation."""
     is_valid, error = validate_record_types([])
@@ -96,6 +164,13 @@ def test_validate_record_types_empty():
     assert "At least one" in error
 
 
+def test_validate_record_types_none():
+    """Test missing record types fail validation instead of raising."""
+    is_valid, error = validate_record_types(None)
+    assert not is_valid
+    assert "At least one" in error
+
+
 @pytest.mark.asyncio
 async def test_lookup_a_record():
     """Test basic A record lookup."""
@@ -209,6 +284,17 @@ async def test_lookup_rejects_invalid_record_types():
     assert "Invalid record types" in result.error
 
 
+@pytest.mark.asyncio
+async def test_lookup_rejects_missing_record_types():
+    """Test lookup rejects a missing record types list."""
+    resolver = DNSResolver()
+    result = await resolver.lookup("example.com", None)
+
+    assert isinstance(result, ErrorResponse)
+    assert result.success is False
+    assert "At least one record type is required" in result.error
+
+
 @pytest.mark.asyncio
 async def test_lookup_rejects_private_resolver():
     """Test lookup rejects private resolver IPs."""
@@ -220,6 +306,21 @@ async def test_lookup_rejects_private_resolver():
     assert "Private" in result.error
 
 
+@pytest.mark.asyncio
+async def test_bulk_lookup_rejects_private_resolver():
+    """Test bulk lookups reject private resolver IPs once for the whole batch."""
+    resolver = DNSResolver()
+    queries = [{"domain": "example.com", "record_types": ["A"]}] * 3
+
+    result = await resolver.bulk_lookup(queries, resolver_ip="192.168.1.1")
+    assert isinstance(result, ErrorResponse)
+    assert "Private" in result.error
+
+    result = await resolver.bulk_reverse_lookup(["8.8.8.8"], resolver_ip="192.168.1.1")
+    assert isinstance(result, ErrorResponse)
+    assert "Private" in result.error
+
+
 @pytest.mark.asyncio
 async def test_bulk_lookup_limit():
     """Test bulk lookup enforces query limit."""
@@ -244,3 +345,490 @@ async def test_bulk_reverse_lookup_limit():
     assert isinstance(result, ErrorResponse)
     assert result.success is False
     assert "limit exceeded" in result.error
+
+
+# Tests for record parsing
+
+
+def test_parse_record_extracts_priority():
+    """Test MX and SRV records expose their priority separately."""
+    mx = _RECORD_PARSERS["MX"](dns.rdata.from_text("IN", "MX", "10 mail.example.com."), "MX", 300)
+    assert mx.value == "mail.example.com."
+    assert mx.priority == 10
+    assert mx.ttl == 300
+
+    srv = _RECORD_PARSERS["SRV"](dns.rdata.from_text("IN", "SRV", "1 5 443 sip.example.com."), "SRV", 60)
+    assert srv.value == "sip.example.com.:443"
+    assert srv.priority == 1
+
+
+def test_parse_record_dnskey():
+    """Test DNSKEY records expose their algorithm and key tag."""
+    rdata = dns.rdata.from_text(
+        "IN",
+        "DNSKEY",
+        "257 3 8 AwEAAaz/tAm8yTn4Mfeh5eyI96WSVexTBAvkMgJzkKTOiW1vkIbzxeF3",
+    )
+    record = _RECORD_PARSERS["DNSKEY"](rdata, "DNSKEY", 3600)
+
+    assert record.algorithm == 8
+    assert record.key_tag == dns.dnssec.key_id(rdata)
+
+
+def test_parse_record_generic():
+    """Test record types without a dedicated parser use the text value."""
+    assert "TXT" not in _RECORD_PARSERS
+    record = _parse_text(dns.rdata.from_text("IN", "TXT", '"v=spf1 ~all"'), "TXT", 300)
+
+    assert record.value == '"v=spf1 ~all"'
+    assert record.priority is None
+
+
+def test_parse_record_address():
+    """Test A and AAAA records use the address as their value."""
+    a = _RECORD_PARSERS["A"](dns.rdata.from_text("IN", "A", "192.0.2.1"), "A", 300)
+    assert a.value == "192.0.2.1"
+
+    aaaa = _RECORD_PARSERS["AAAA"](dns.rdata.from_text("IN", "AAAA", "2001:0DB8::0001"), "AAAA", 300)
+    assert aaaa.value == "2001:db8::1"
+
+
+# Tests for reverse name construction
+
+
+def test_reverse_name_matches_dnspython():
+    """Test reverse names match dns.reversename for IPv4, IPv6 and mapped addresses."""
+    for ip in ["8.8.8.8", "2001:4860:4860::8888", "::ffff:192.0.2.1", "::1"]:
+        assert _reverse_name(ip) == dns.reversename.from_address(ip)
+
+
+def test_reverse_name_invalid():
+    """Test invalid addresses yield no reverse name."""
+    for ip in ["not-an-ip", "1.2.3", "01.2.3.4", "fe80::1%eth0"]:
+        assert _reverse_name(ip) is None
+
+
+@pytest.mark.asyncio
+async def test_reverse_lookup_invalid_ip():
+    """Test invalid addresses are rejected without a query."""
+    resolver = DNSResolver()
+    result = await resolver.reverse_lookup("not-an-ip")
+
+    assert isinstance(result, ErrorResponse)
+    assert result.ip == "not-an-ip"
+    assert "Invalid IP address" in result.error
+
+
+@pytest.mark.asyncio
+async def test_reverse_lookup_non_string_ip():
+    """Test non-string, non-address input is rejected with an error response."""
+    resolver = DNSResolver()
+    for ip in [None, 8, ["8.8.8.8"]]:
+        result = await resolver.reverse_lookup(ip)
+
+        assert isinstance(result, ErrorResponse)
+        assert result.ip == str(ip)
+        assert "Invalid IP address" in result.error
+
+
+@pytest.mark.asyncio
+async def test_reverse_lookup_accepts_ip_objects(monkeypatch):
+    """Test parsed ipaddress objects are reverse-resolved like their text form."""
+    queried = []
+
+    async def fake_resolve_ptr(self, resolver, ip, rev_name, cache_key):
+        queried.append((ip, rev_name))
+        return "dns.google.", 300
+
+    monkeypatch.setattr(DNSResolver, "_resolve_ptr", fake_resolve_ptr)
+    resolver = DNSResolver()
+
+    result = await resolver.reverse_lookup(ipaddress.ip_address("2001:4860:4860::8888"))
+
+    assert result.ip == "2001:4860:4860::8888"
+    assert queried == [("2001:4860:4860::8888", dns.reversename.from_address("2001:4860:4860::8888"))]
+
+
+# Tests for resolver reuse
+
+
+def test_resolver_reused_per_nameserver():
+    """Test resolver instances are reused per nameserver with separate caches."""
+    resolver = DNSResolver()
+
+    google = resolver._create_resolver("8.8.8.8")
+    assert resolver._create_resolver("8.8.8.8") is google
+
+    cloudflare = resolver._create_resolver("1.1.1.1")
+    assert cloudflare is not google
+    assert cloudflare.cache is not google.cache
+
+
+def test_resolver_uses_edns():
+    """Test resolvers advertise the EDNS0 UDP payload size."""
+    resolver = DNSResolver()
+    res = resolver._create_resolver("8.8.8.8")
+
+    assert res.edns == 0
+    assert res.payload == EDNS_PAYLOAD_SIZE
+
+
+def test_resolver_skips_search_domains():
+    """Test resolvers never expand queries with resolv.conf search domains."""
+    resolver = DNSResolver()
+    res = resolver._create_resolver()
+
+    assert res.use_search_by_default is False
+
+
+def test_resolver_uses_slots():
+    """Test resolver instances carry no per-instance __dict__."""
+    assert not hasattr(DNSResolver(), "__dict__")
+
+
+def test_resolver_pool_is_bounded():
+    """Test the resolver pool does not grow past its limit."""
+    resolver = DNSResolver()
+    for i in range(MAX_CACHED_RESOLVERS + 5):
+        resolver._create_resolver(f"8.8.{i}.8")
+
+    assert len(resolver._resolvers) == MAX_CACHED_RESOLVERS
+
+
+def test_resolver_pool_evicts_least_recently_used():
+    """Test a resolver in regular use survives a stream of new nameservers."""
+    resolver = DNSResolver()
+    default = resolver._create_resolver()
+    for i in range(MAX_CACHED_RESOLVERS * 2):
+        resolver._create_resolver(f"8.8.{i}.8")
+        assert resolver._create_resolver() is default
+
+    assert "8.8.0.8" not in resolver._resolvers
+
+
+# Tests for answer caching
+
+
+@pytest.mark.asyncio
+async def test_lookup_served_from_cache(monkeypatch):
+    """Test repeated lookups are answered from cache without querying again."""
+    queried = []
+
+    async def fake_resolve_type(self, resolver, domain, rdtype):
+        queried.append(rdtype)
+        return [DNSRecord(type=rdtype, value="192.0.2.1", ttl=300)], None, 1
+
+    monkeypatch.setattr(DNSResolver, "_resolve_type", fake_resolve_type)
+    resolver = DNSResolver()
+
+    first = await resolver.lookup("example.com", ["A"])
+    second = await resolver.lookup("EXAMPLE.com", ["a"])
+
+    assert queried == ["A"]
+    assert second.domain == "EXAMPLE.com"
+    assert second.records == first.records
+
+
+def _seed_answer_cache(res, qname, rdtype, text, ttl, remaining):
+    """Put an answer into a resolver's dnspython cache, as if received earlier."""
+    qname = dns.name.from_text(qname)
+    rdtype = dns.rdatatype.from_text(rdtype)
+    response = dns.message.make_response(dns.message.make_query(qname, rdtype))
+    rrset = response.find_rrset(response.answer, qname, dns.rdataclass.IN, rdtype, create=True)
+    rrset.add(dns.rdata.from_text(dns.rdataclass.IN, rdtype, text), ttl)
+    answer = dns.resolver.Answer(qname, rdtype, dns.rdataclass.IN, response)
+    answer.expiration = time.time() + remaining
+    res.cache.put((qname, rdtype, dns.rdataclass.IN), answer)
+
+
+@pytest.mark.asyncio
+async def test_lookup_ttl_counts_down_for_cached_answers():
+    """Test an answer from dnspython's cache reports its remaining TTL."""
+    resolver = DNSResolver()
+    _seed_answer_cache(resolver._create_resolver(), "example.com.", "A", "192.0.2.1", 300, 50)
+
+    result = await resolver.lookup("example.com", ["A"])
+
+    assert [record.value for record in result.records] == ["192.0.2.1"]
+    assert result.records[0].ttl <= 50
+
+
+@pytest.mark.asyncio
+async def test_reverse_lookup_ttl_counts_down_for_cached_answers():
+    """Test a PTR answer from dnspython's cache reports its remaining TTL."""
+    resolver = DNSResolver()
+    _seed_answer_cache(
+        resolver._create_resolver(), "1.2.0.192.in-addr.arpa.", "PTR", "host.example.", 300, 50
+    )
+
+    result = await resolver.reverse_lookup("192.0.2.1")
+
+    assert result.hostname == "host.example"
+    assert result.ttl <= 50
+
+
+@pytest.mark.asyncio
+async def test_lookup_queries_record_types_concurrently(monkeypatch):
+    """Test each record type is queried at the same time rather than in turn."""
+    running = 0
+    peak = 0
+
+    async def fake_resolve_type(self, resolver, domain, rdtype):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return [DNSRecord(type=rdtype, value="example", ttl=300)], None, 1
+
+    monkeypatch.setattr(DNSResolver, "_resolve_type", fake_resolve_type)
+    resolver = DNSResolver()
+
+    result = await resolver.lookup("example.com", ["A", "AAAA", "MX", "TXT"])
+
+    assert peak == 4
+    assert [record.type for record in result.records] == ["A", "AAAA", "MX", "TXT"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_partial_failure_not_cached(monkeypatch):
+    """Test a lookup where one type failed is not served from cache."""
+    queried = []
+
+    async def fake_resolve_type(self, resolver, domain, rdtype):
+        queried.append(rdtype)
+        if rdtype == "MX" and queried.count("MX") == 1:
+            return [], dns.exception.Timeout(), 3
+        return [DNSRecord(type=rdtype, value="example", ttl=300)], None, 1
+
+    monkeypatch.setattr(DNSResolver, "_resolve_type", fake_resolve_type)
+    resolver = DNSResolver()
+
+    first = await resolver.lookup("example.com", ["A", "MX"])
+    second = await resolver.lookup("example.com", ["A", "MX"])
+
+    assert [record.type for record in first.records] == ["A"]
+    assert [record.type for record in second.records] == ["A", "MX"]
+    assert queried.count("MX") == 2
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_isolated_from_response_mutation(monkeypatch):
+    """Test mutating a returned records list does not alter cached results."""
+
+    async def fake_resolve_type(self, resolver, domain, rdtype):
+        return [DNSRecord(type=rdtype, value="192.0.2.1", ttl=300)], None, 1
+
+    monkeypatch.setattr(DNSResolver, "_resolve_type", fake_resolve_type)
+    resolver = DNSResolver()
+
+    first = await resolver.lookup("example.com", ["A"])
+    first.records.append("not a record")
+    second = await resolver.lookup("example.com", ["A"])
+    second.records.clear()
+    third = await resolver.lookup("example.com", ["A"])
+
+    assert [record.value for record in third.records] == ["192.0.2.1"]
+
+
+# Tests for bounded concurrency
+
+
+@pytest.mark.asyncio
+async def test_bounded_map_preserves_order_and_limit():
+    """Test bounded map returns input order and caps concurrency."""
+    running = 0
+    peak = 0
+
+    async def work(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - i % 5))
+        running -= 1
+        return i
+
+    results = await _bounded_map([work(i) for i in range(20)], asyncio.Semaphore(4))
+
+    assert results == list(range(20))
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_bounded_map_cancellation_cancels_work():
+    """Test cancelling the caller cancels outstanding work and frees the semaphore."""
+    started = 0
+    finished = 0
+
+    async def work():
+        nonlocal started, finished
+        started += 1
+        await asyncio.sleep(0.2)
+        finished += 1
+
+    semaphore = asyncio.Semaphore(2)
+    task = asyncio.create_task(_bounded_map([work() for _ in range(6)], semaphore))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0.3)
+
+    assert started == 2
+    assert finished == 0
+    assert not semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_bounded_map_returns_exceptions():
+    """Test bounded map returns exceptions in place of results."""
+
+    async def work(i):
+        if i == 1:
+            raise RuntimeError("boom")
+        return i
+
+    results = await _bounded_map([work(i) for i in range(3)], asyncio.Semaphore(2))
+
+    assert results[0] == 0
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_lookup_deduplicates_queries(monkeypatch):
+    """Test repeated bulk queries are resolved once and fanned back out in order."""
+    looked_up = []
+
+    async def fake_lookup(self, domain, record_types, resolver, nameserver):
+        looked_up.append((domain, tuple(record_types)))
+        return LookupResponse(domain=domain, records=[], query_time_ms=0)
+
+    monkeypatch.setattr(DNSResolver, "_lookup_with_resolver", fake_lookup)
+    resolver = DNSResolver()
+
+    queries = [
+        {"domain": "a.example"},
+        {"domain": "b.example", "record_types": ["MX"]},
+        {"domain": "a.example", "record_types": ["A"]},
+        {"domain": "b.example", "record_types": ["MX"]},
+    ]
+    results = await resolver.bulk_lookup(queries)
+
+    assert sorted(looked_up) == [("a.example", ("A",)), ("b.example", ("MX",))]
+    assert [r.domain for r in results] == ["a.example", "b.example", "a.example", "b.example"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_reverse_lookup_deduplicates_ips(monkeypatch):
+    """Test repeated IPs in a bulk reverse lookup are resolved once."""
+    looked_up = []
+
+    async def fake_reverse(self, ip, resolver, nameserver):
+        looked_up.append(ip)
+        return ReverseLookupResponse(ip=ip, hostname="host.example", ttl=300, query_time_ms=0)
+
+    monkeypatch.setattr(DNSResolver, "_reverse_lookup_with_resolver", fake_reverse)
+    resolver = DNSResolver()
+
+    results = await resolver.bulk_reverse_lookup(["192.0.2.1", "192.0.2.2", "192.0.2.1"])
+
+    assert sorted(looked_up) == ["192.0.2.1", "192.0.2.2"]
+    assert [r.ip for r in results] == ["192.0.2.1", "192.0.2.2", "192.0.2.1"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_lookup_unhashable_item_fails_alone():
+    """Test an unhashable bulk query yields its own error instead of failing the batch."""
+    resolver = DNSResolver()
+    queries = [
+        {"domain": "example.com", "record_types": [["A"]]},
+        {"domain": "invalid domain"},
+    ]
+
+    results = await resolver.bulk_lookup(queries)
+
+    assert len(results) == 2
+    assert all(isinstance(r, ErrorResponse) for r in results)
+    assert results[0].domain == "example.com"
+
+
+@pytest.mark.asyncio
+async def test_bulk_reverse_lookup_unhashable_item_fails_alone():
+    """Test an unhashable IP yields its own error instead of failing the batch."""
+    resolver = DNSResolver()
+
+    results = await resolver.bulk_reverse_lookup([["8.8.8.8"], "not-an-ip", ["8.8.8.8"]])
+
+    assert len(results) == 3
+    assert all(isinstance(r, ErrorResponse) for r in results)
+    assert results[1].ip == "not-an-ip"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bulk_lookups_share_limit(monkeypatch):
+    """Test simultaneous bulk calls share one concurrency limit."""
+    running = 0
+    peak = 0
+
+    async def fake_lookup(self, domain, record_types, resolver, nameserver):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return LookupResponse(domain=domain, records=[], query_time_ms=0)
+
+    monkeypatch.setattr(DNSResolver, "_lookup_with_resolver", fake_lookup)
+    resolver = DNSResolver()
+
+    batches = [[{"domain": f"host{i}.batch{b}.example"} for i in range(30)] for b in range(2)]
+    await asyncio.gather(*(resolver.bulk_lookup(batch) for batch in batches))
+
+    assert peak == MAX_CONCURRENT_QUERIES
+
+
+@pytest.mark.asyncio
+async def test_cancelled_bulk_lookup_releases_shared_limit(monkeypatch):
+    """Test cancelling a bulk call frees its slots for other bulk calls."""
+
+    async def fake_lookup(self, domain, record_types, resolver, nameserver):
+        if domain.endswith(".slow.example"):
+            await asyncio.sleep(10)
+        return LookupResponse(domain=domain, records=[], query_time_ms=0)
+
+    monkeypatch.setattr(DNSResolver, "_lookup_with_resolver", fake_lookup)
+    resolver = DNSResolver()
+
+    slow = [{"domain": f"host{i}.slow.example"} for i in range(MAX_CONCURRENT_QUERIES * 2)]
+    task = asyncio.create_task(resolver.bulk_lookup(slow))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    fast = [{"domain": f"host{i}.fast.example"} for i in range(MAX_CONCURRENT_QUERIES)]
+    results = await asyncio.wait_for(resolver.bulk_lookup(fast), timeout=1)
+
+    assert all(isinstance(r, LookupResponse) for r in results)
+    assert not resolver._bulk_semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_bulk_lookup_isolates_unexpected_errors(monkeypatch):
+    """Test an unexpected exception in one bulk query becomes an ErrorResponse."""
+
+    async def fake_lookup(self, domain, record_types, resolver, nameserver):
+        if domain == "bad.example":
+            raise RuntimeError("boom")
+        return LookupResponse(domain=domain, records=[], query_time_ms=0)
+
+    monkeypatch.setattr(DNSResolver, "_lookup_with_resolver", fake_lookup)
+    resolver = DNSResolver()
+
+    results = await resolver.bulk_lookup([{"domain": "good.example"}, {"domain": "bad.example"}])
+
+    assert isinstance(results[0], LookupResponse)
+    assert isinstance(results[1], ErrorResponse)
+    assert results[1].domain == "bad.example"
+    assert results[1].error == "boom"
@@ -1,9 +1,14 @@
 """Tests for MCP server."""
 
+import json
+
 import pytest
-from mcp.types import ListToolsRequest
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
 
+from dns_mcp_server.resolver import DNSResolver
+from dns_mcp_server import server as server_module
 from dns_mcp_server.server import create_server
+from dns_mcp_server.types import DNSRecord, ErrorResponse, LookupResponse
 
 
 @pytest.mark.asyncio
@@ -28,6 +33,15 @@ async def test_server_has_tools():
     assert "dns_reverse_bulk" in tool_names
 
 
+@pytest.mark.asyncio
+async def test_list_tools_result_is_shared():
+    """Test list_tools returns the prebuilt result instead of rebuilding it."""
+    first = await create_server().request_handlers[ListToolsRequest](None)
+    second = await create_server().request_handlers[ListToolsRequest](None)
+
+    assert first.root is second.root
+
+
 @pytest.mark.asyncio
 async def test_dns_lookup_tool_schema():
     """Test that dns_lookup tool has correct schema."""
@@ -94,3 +108,68 @@ async def test_dns_reverse_bulk_tool_schema():
     # Verify required properties
     assert "ips" in dns_reverse_bulk_tool.inputSchema["properties"]
     assert "ips" in dns_reverse_bulk_tool.inputSchema["required"]
+
+
+async def call_tool(server, name, arguments):
+    """Invoke a tool through the registered call_tool handler and decode its JSON."""
+    handler = server.request_handlers.get(CallToolRequest)
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    result = await handler(request)
+    return json.loads(result.root.content[0].text)
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_returns_error():
+    """Test that unknown tool names return an error payload."""
+    server = create_server()
+
+    result = await call_tool(server, "dns_unknown", {})
+
+    assert result["success"] is False
+    assert "Unknown tool" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_dns_bulk_limit_returns_error():
+    """Test that exceeding the bulk limit returns a single error payload."""
+    server = create_server()
+
+    queries = [{"domain": "example.com"}] * 101
+    result = await call_tool(server, "dns_bulk", {"queries": queries})
+
+    assert result["success"] is False
+    assert "limit exceeded" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_create_server_uses_injected_resolver():
+    """Test that tool calls go through a resolver passed to create_server."""
+
+    class StubResolver(DNSResolver):
+        async def lookup(self, domain, record_types, resolver_ip=None):
+            return LookupResponse(domain=domain, records=[], resolver="stub", query_time_ms=0)
+
+    server = create_server(resolver=StubResolver())
+
+    result = await call_tool(server, "dns_lookup", {"domain": "example.com"})
+
+    assert result["success"] is True
+    assert result["resolver"] == "stub"
+
+
+def test_stdlib_serialization_matches_orjson(monkeypatch):
+    """Test the stdlib JSON fallback produces the same text as orjson."""
+    pytest.importorskip("orjson")
+    record = DNSRecord(type="TXT", value="v=spf1 ~all", ttl=300)
+    results = [
+        LookupResponse(domain="bücher.example", records=[record], query_time_ms=12),
+        ErrorResponse(domain="nonexistent.invalid", error="NXDOMAIN", retries_attempted=0),
+    ]
+    expected = (server_module._dumps(results[0].to_dict()), server_module._dumps_bulk(results))
+
+    monkeypatch.setattr(server_module, "orjson", None)
+
+    assert (server_module._dumps(results[0].to_dict()), server_module._dumps_bulk(results)) == expected
@@ -1,5 +1,9 @@
 """Tests for response types."""
 
+from dataclasses import FrozenInstanceError, asdict
+
+import pytest
+
 from dns_mcp_server.types import (
     DNSRecord,
     LookupResponse,
@@ -53,3 +57,27 @@ def test_error_response_creation():
     )
     assert response.success is False
     assert response.error == "NXDOMAIN"
+
+
+def test_to_dict_matches_asdict():
+    record = DNSRecord(type="MX", value="mail.example.com", ttl=3600, priority=10)
+    responses = [
+        LookupResponse(domain="example.com", records=[record], query_time_ms=45),
+        ReverseLookupResponse(ip="8.8.8.8", hostname="dns.google", ttl=3600, query_time_ms=32),
+        ErrorResponse(domain="nonexistent.invalid", error="NXDOMAIN", retries_attempted=3),
+    ]
+    assert record.to_dict() == asdict(record)
+    for response in responses:
+        assert response.to_dict() == {**asdict(response), "success": response.success}
+
+
+def test_responses_use_slots():
+    record = DNSRecord(type="A", value="93.184.216.34", ttl=3600)
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(ErrorResponse(error="NXDOMAIN", retries_attempted=1), "__dict__")
+
+
+def test_responses_are_frozen():
+    response = ErrorResponse(error="NXDOMAIN", retries_attempted=1)
+    with pytest.raises(FrozenInstanceError):
+        response.domain = "example.com"